@@ -22,6 +22,12 @@ analysis_queue = Queue()
 
 class AnalysisRequest:
     """분석 요청 객체"""
+    # 요청마다 생성되어 pending_requests에 보관되므로 인스턴스 __dict__ 없이 고정 슬롯 사용
+    __slots__ = (
+        "id", "stock_code", "company_name", "chat_id", "avg_price", "period", "tone",
+        "background", "status", "result", "report_path", "html_path", "created_at", "message_id"
+    )
+
     def __init__(self, stock_code: str, company_name: str, chat_id: int = None,
                  avg_price: float = None, period: int = None, tone: str = None,
                  background: str = None, message_id: int = None):
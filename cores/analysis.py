@@ -15,7 +15,7 @@ from cores.stock_chart import (
 from cores.utils import clean_markdown
 
 
-# 시장 분석 캐시 저장소 (전역 변수)
+# 시장 분석 캐시 저장소 (전역 변수, 기준일 -> 보고서)
 _market_analysis_cache = {}
 
 async def analyze_stock(company_code: str = "000660", company_name: str = "SK하이닉스", reference_date: str = None):
@@ -59,15 +59,15 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
                 try:
                     agent = agents[section]
                     if section == "market_index_analysis":
-                        # 캐시에 데이터가 있는지 확인
-                        if "report" in _market_analysis_cache:
-                            logger.info(f"Using cached market analysis")
-                            report = _market_analysis_cache["report"]
+                        # 시장 분석은 종목과 무관하므로 기준일별로 캐시
+                        report = _market_analysis_cache.get(reference_date)
+                        if report is not None:
+                            logger.info(f"Using cached market analysis ({reference_date})")
                         else:
                             logger.info(f"Generating new market analysis")
                             report = await generate_market_report(agent, section, reference_date, logger)
                             # 캐시에 저장
-                            _market_analysis_cache["report"] = report
+                            _market_analysis_cache[reference_date] = report
                     else:
                         report = await generate_report(agent, section, company_name, company_code, reference_date, logger)
                     section_reports[section] = report
@@ -76,11 +76,10 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
                     section_reports[section] = f"분석 실패: {section}"
 
         # 6. 다른 보고서들의 내용을 통합
-        combined_reports = ""
-        for section in base_sections:
-            if section in section_reports:
-                combined_reports += f"\n\n--- {section.upper()} ---\n\n"
-                combined_reports += section_reports[section]
+        combined_reports = "".join(
+            f"\n\n--- {section.upper()} ---\n\n{section_reports[section]}"
+            for section in base_sections if section in section_reports
+        )
 
         # 7. 투자 전략 생성
         try:
@@ -96,11 +95,10 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
             section_reports["investment_strategy"] = "투자 전략 분석 실패"
 
         # 8. 모든 섹션을 포함한 종합 보고서 생성
-        all_reports = ""
-        for section in base_sections + ["investment_strategy"]:
-            if section in section_reports:
-                all_reports += f"\n\n--- {section.upper()} ---\n\n"
-                all_reports += section_reports[section]
+        all_reports = "".join(
+            f"\n\n--- {section.upper()} ---\n\n{section_reports[section]}"
+            for section in base_sections + ["investment_strategy"] if section in section_reports
+        )
 
         # 9. 요약 생성
         try:
@@ -144,40 +142,37 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
             fundamentals_chart_html = None
 
         # 11. 최종 보고서 구성
+        # 차트 HTML이 수백 KB에 달하므로 조각을 모아 한 번에 결합
         disclaimer = get_disclaimer()
-        final_report = disclaimer + "\n\n" + executive_summary + "\n\n"
+        report_parts = [disclaimer, "\n\n", executive_summary, "\n\n"]
 
         all_sections = base_sections + ["investment_strategy"]
         for section in all_sections:
             if section in section_reports:
-                final_report += section_reports[section] + "\n\n"
+                report_parts += [section_reports[section], "\n\n"]
 
                 # price_volume_analysis 섹션 다음에 가격 차트와 거래량 차트 추가
                 if section == "price_volume_analysis" and (price_chart_html or volume_chart_html):
-                    final_report += "\n## 가격 및 거래량 차트\n\n"
+                    report_parts.append("\n## 가격 및 거래량 차트\n\n")
 
                     if price_chart_html:
-                        final_report += f"### 가격 차트\n\n"
-                        final_report += price_chart_html + "\n\n"
+                        report_parts += ["### 가격 차트\n\n", price_chart_html, "\n\n"]
 
                     if volume_chart_html:
-                        final_report += f"### 거래량 차트\n\n"
-                        final_report += volume_chart_html + "\n\n"
+                        report_parts += ["### 거래량 차트\n\n", volume_chart_html, "\n\n"]
 
                 # company_status 섹션 다음에 시가총액 차트와 기본 지표 차트 추가
                 elif section == "company_status" and (market_cap_chart_html or fundamentals_chart_html):
-                    final_report += "\n## 시가총액 및 기본 지표 차트\n\n"
+                    report_parts.append("\n## 시가총액 및 기본 지표 차트\n\n")
 
                     if market_cap_chart_html:
-                        final_report += f"### 시가총액 추이\n\n"
-                        final_report += market_cap_chart_html + "\n\n"
+                        report_parts += ["### 시가총액 추이\n\n", market_cap_chart_html, "\n\n"]
 
                     if fundamentals_chart_html:
-                        final_report += f"### 기본 지표 분석\n\n"
-                        final_report += fundamentals_chart_html + "\n\n"
+                        report_parts += ["### 기본 지표 분석\n\n", fundamentals_chart_html, "\n\n"]
 
         # 12. 최종 마크다운 정리
-        final_report = clean_markdown(final_report)
+        final_report = clean_markdown("".join(report_parts))
 
         logger.info(f"Finalized report for {company_name} - {len(final_report)} characters")
         logger.info(f"Analysis completed for {company_name}.")
@@ -40,6 +40,7 @@ async def generate_report(agent, section, company_name, company_code, reference_
     logger.info(f"Completed {section} - {len(report)} characters")
     return report
 
+
 async def generate_market_report(agent, section, reference_date, logger):
     """에이전트를 사용하여 시장 분석 보고서 생성"""
     llm = await agent.attach_llm(OpenAIAugmentedLLM)
@@ -75,15 +76,11 @@ async def generate_market_report(agent, section, reference_date, logger):
 async def generate_summary(section_reports, company_name, company_code, reference_date, logger):
     """섹션 보고서들을 바탕으로 요약 생성"""
     try:
-        from mcp_agent.agents.agent import Agent
-        from mcp_agent.workflows.llm.augmented_llm import RequestParams
-        from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
-        
         # 모든 섹션을 포함한 종합 보고서 생성
-        all_reports = ""
-        for section, report in section_reports.items():
-            all_reports += f"\n\n--- {section.upper()} ---\n\n"
-            all_reports += report
+        all_reports = "".join(
+            f"\n\n--- {section.upper()} ---\n\n{report}"
+            for section, report in section_reports.items()
+        )
         
         logger.info(f"Generating executive summary for {company_name}...")
         summary_agent = Agent(
@@ -134,10 +131,6 @@ async def generate_summary(section_reports, company_name, company_code, referenc
 
 async def generate_investment_strategy(section_reports, combined_reports, company_name, company_code, reference_date, logger):
     """투자 전략 보고서 생성"""
-    from mcp_agent.agents.agent import Agent
-    from mcp_agent.workflows.llm.augmented_llm import RequestParams
-    from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
-    
     try:
         logger.info(f"Processing investment_strategy for {company_name}...")
         investment_strategy_agent = Agent(
@@ -1,5 +1,4 @@
 import re
-import subprocess
 
 # WiseReport URL 템플릿 설정
 WISE_REPORT_BASE = "https://comp.wisereport.co.kr/company/"
@@ -31,3 +30,14 @@ def clean_markdown(text: str) -> str:
 def get_wise_report_url(report_type: str, company_code: str) -> str:
     """WiseReport URL 생성"""
     return WISE_REPORT_BASE + URLS[report_type].format(company_code)
+
+
+def decode_subprocess_output(data: bytes) -> str:
+    """서브프로세스 출력 디코딩 - 인코딩 문제 해결"""
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        try:
+            return data.decode('cp949')  # Windows 한국어 인코딩
+        except UnicodeDecodeError:
+            return data.decode('utf-8', errors='ignore')
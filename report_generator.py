@@ -18,6 +18,8 @@ from mcp_agent.app import MCPApp
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 from mcp_agent.workflows.llm.augmented_llm_anthropic import AnthropicAugmentedLLM
 
+from cores.utils import decode_subprocess_output
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
@@ -230,22 +232,8 @@ def save_html_report(stock_code: str, company_name: str, markdown_content: str)
     return save_html_report_from_content(stock_code, company_name, html_content)
 
 
-def generate_report_response_sync(stock_code: str, company_name: str) -> str:
-    """
-    종목 상세 보고서를 동기 방식으로 생성 (백그라운드 스레드에서 호출됨)
-    """
-    try:
-        logger.info(f"동기식 보고서 생성 시작: {stock_code} ({company_name})")
-
-        # 현재 날짜를 YYYYMMDD 형식으로 변환
-        reference_date = datetime.now().strftime("%Y%m%d")
-
-        # 별도의 프로세스로 분석 수행
-        # 이 방법은 새로운 Python 프로세스를 생성하여 분석을 수행하므로 이벤트 루프 충돌 없음
-        cmd = [
-            sys.executable,  # 현재 Python 인터프리터
-            "-c",
-            f"""
+# 외부 프로세스에서 실행할 분석 스크립트 (인자: 종목 코드, 종목명, 기준일)
+_ANALYSIS_SUBPROCESS_SCRIPT = """
 import asyncio
 import json
 import sys
@@ -254,42 +242,66 @@ from cores.analysis import analyze_stock
 async def run():
     try:
         result = await analyze_stock(
-            company_code="{stock_code}", 
-            company_name="{company_name}", 
-            reference_date="{reference_date}"
+            company_code=sys.argv[1],
+            company_name=sys.argv[2],
+            reference_date=sys.argv[3]
         )
         # 구분자를 사용하여 결과 출력의 시작과 끝을 표시
         print("RESULT_START")
-        print(json.dumps({{"success": True, "result": result}}))
+        print(json.dumps({"success": True, "result": result}))
         print("RESULT_END")
     except Exception as e:
         # 구분자를 사용하여 에러 출력의 시작과 끝을 표시
         print("RESULT_START")
-        print(json.dumps({{"success": False, "error": str(e)}}))
+        print(json.dumps({"success": False, "error": str(e)}))
         print("RESULT_END")
 
 if __name__ == "__main__":
     asyncio.run(run())
-            """
+"""
+
+
+def generate_report_response_sync(stock_code: str, company_name: str) -> str:
+    """
+    종목 상세 보고서를 동기 방식으로 생성 (백그라운드 스레드에서 호출됨)
+    """
+    try:
+        logger.info(f"동기식 보고서 생성 시작: {stock_code} ({company_name})")
+
+        # 현재 날짜를 YYYYMMDD 형식으로 변환
+        reference_date = datetime.now().strftime("%Y%m%d")
+
+        # 별도의 프로세스로 분석 수행
+        # 이 방법은 새로운 Python 프로세스를 생성하여 분석을 수행하므로 이벤트 루프 충돌 없음
+        # 스크립트는 고정이고 종목 정보는 인자로 전달
+        cmd = [
+            sys.executable,  # 현재 Python 인터프리터
+            "-c",
+            _ANALYSIS_SUBPROCESS_SCRIPT,
+            stock_code,
+            company_name,
+            reference_date
         ]
 
         logger.info(f"외부 프로세스 실행: {stock_code}")
-        process = subprocess.run(cmd, capture_output=True, text=True, timeout=600)  # 10분 타임아웃
+        # 출력은 bytes 그대로 받아 결과 JSON만 파싱 (정상 경로에서는 전체 로그를 디코딩하지 않음)
+        process = subprocess.run(cmd, capture_output=True, timeout=600)  # 10분 타임아웃
 
         # 출력 초기화 - 경고 방지를 위해 변수 미리 선언
-        output = ""
+        output = b""
 
         # 출력 파싱 - 구분자를 사용하여 실제 JSON 출력 부분만 추출
         try:
             output = process.stdout
             # 로그 출력에서 RESULT_START와 RESULT_END 사이의 JSON 데이터만 추출
-            if "RESULT_START" in output and "RESULT_END" in output:
-                result_start = output.find("RESULT_START") + len("RESULT_START")
-                result_end = output.find("RESULT_END")
-                json_str = output[result_start:result_end].strip()
+            # 결과는 출력의 마지막에 찍히므로 앞쪽 로그 전체를 훑지 않도록 뒤에서부터 탐색
+            result_end = output.rfind(b"RESULT_END")
+            result_start = output.rfind(b"RESULT_START", 0, result_end) if result_end != -1 else -1
+            if result_start != -1:
+                json_bytes = output[result_start + len(b"RESULT_START"):result_end].strip()
 
-                # JSON 파싱
-                parsed_output = json.loads(json_str)
+                # JSON 파싱 (json.loads는 bytes를 직접 처리)
+                parsed_output = json.loads(json_bytes)
 
                 if parsed_output.get('success', False):
                     result = parsed_output.get('result', '')
@@ -301,14 +313,14 @@ if __name__ == "__main__":
                     return f"분석 중 오류가 발생했습니다: {error}"
             else:
                 # 구분자를 찾을 수 없는 경우 - 프로세스 실행 자체에 문제가 있을 수 있음
-                logger.error(f"외부 프로세스 출력에서 결과 구분자를 찾을 수 없습니다: {output[:500]}")
+                logger.error(f"외부 프로세스 출력에서 결과 구분자를 찾을 수 없습니다: {decode_subprocess_output(output)[:500]}")
                 # stderr에 에러 로그가 있는지 확인
                 if process.stderr:
-                    logger.error(f"외부 프로세스 에러 출력: {process.stderr[:500]}")
+                    logger.error(f"외부 프로세스 에러 출력: {decode_subprocess_output(process.stderr)[:500]}")
                 return f"분석 결과를 찾을 수 없습니다. 로그를 확인하세요."
         except json.JSONDecodeError as e:
             logger.error(f"외부 프로세스 출력 파싱 실패: {e}")
-            logger.error(f"출력 내용: {output[:1000]}")
+            logger.error(f"출력 내용: {decode_subprocess_output(output)[:1000]}")
             return f"분석 결과 파싱 중 오류가 발생했습니다. 로그를 확인하세요."
 
     except subprocess.TimeoutExpired:
@@ -18,6 +18,10 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from dotenv import load_dotenv
+
+from cores.utils import decode_subprocess_output
+
 # 로거 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -40,6 +44,19 @@ TELEGRAM_MSGS_DIR.mkdir(exist_ok=True)
 PDF_REPORTS_DIR.mkdir(exist_ok=True)
 (TELEGRAM_MSGS_DIR / "sent").mkdir(exist_ok=True)
 
+
+# 배치 출력 한 줄의 최대 길이 (asyncio 기본값 64KiB는 DataFrame 덤프 등 긴 줄에서 ValueError 발생)
+_BATCH_STREAM_LIMIT = 16 * 1024 * 1024
+
+
+async def _log_stream_lines(stream, log_func, label):
+    """서브프로세스 스트림을 줄 단위로 읽어 로그로 출력"""
+    async for raw_line in stream:
+        line = decode_subprocess_output(raw_line).rstrip()
+        if line:
+            log_func(f"{label}: {line}")
+
+
 class StockAnalysisOrchestrator:
     """주식 분석 및 텔레그램 전송 오케스트레이터"""
 
@@ -47,6 +64,11 @@ class StockAnalysisOrchestrator:
         """초기화"""
         self.selected_tickers = {}  # 선정된 종목 정보 저장
 
+        # 환경 변수에서 텔레그램 채널 ID 및 봇 토큰 가져오기 (.env는 한 번만 로드)
+        load_dotenv()
+        self.telegram_channel_id = os.getenv("TELEGRAM_CHANNEL_ID")
+        self.telegram_bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
+
     async def run_trigger_batch(self, mode):
         """
         트리거 배치 실행 및 결과 저장 (비동기 버전)
@@ -60,41 +82,38 @@ class StockAnalysisOrchestrator:
         logger.info(f"트리거 배치 실행 시작: {mode}")
         try:
             # 배치 프로세스 실행
-            import subprocess
-
             # 임시 파일에 결과 저장
             results_file = f"trigger_results_{mode}_{datetime.now().strftime('%Y%m%d')}.json"
 
             # 명령 실행 - asyncio.create_subprocess_exec을 사용하여 비동기적으로 실행
-            import asyncio
             process = await asyncio.create_subprocess_exec(
                 sys.executable, "trigger_batch.py", mode, "INFO", "--output", results_file,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                limit=_BATCH_STREAM_LIMIT
             )
 
-            stdout, stderr = await process.communicate()
-
-            # 로그 출력 - 인코딩 문제 해결
-            if stdout:
-                try:
-                    stdout_text = stdout.decode('utf-8')
-                except UnicodeDecodeError:
-                    try:
-                        stdout_text = stdout.decode('cp949')  # Windows 한국어 인코딩
-                    except UnicodeDecodeError:
-                        stdout_text = stdout.decode('utf-8', errors='ignore')
-                logger.info(f"배치 출력:\n{stdout_text}")
-                
-            if stderr:
-                try:
-                    stderr_text = stderr.decode('utf-8')
-                except UnicodeDecodeError:
+            # 출력 전체를 메모리에 모으지 않고 줄 단위로 바로 로그에 기록
+            # trigger_batch는 일반 로그도 stderr(StreamHandler)로 남기므로 레벨은 원본 로그 줄에 맡김
+            readers = [
+                asyncio.create_task(_log_stream_lines(process.stdout, logger.info, "배치 출력")),
+                asyncio.create_task(_log_stream_lines(process.stderr, logger.info, "배치 로그"))
+            ]
+            try:
+                await asyncio.gather(*readers)
+                await process.wait()
+            finally:
+                # 스트림 읽기 중 오류가 나면 자식 프로세스가 파이프에 막힌 채 남지 않도록 정리
+                if process.returncode is None:
+                    for reader in readers:
+                        reader.cancel()
+                    await asyncio.gather(*readers, return_exceptions=True)
                     try:
-                        stderr_text = stderr.decode('cp949')  # Windows 한국어 인코딩
-                    except UnicodeDecodeError:
-                        stderr_text = stderr.decode('utf-8', errors='ignore')
-                logger.warning(f"배치 오류:\n{stderr_text}")
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                    # 남은 출력을 비워야 파이프가 닫히고 종료 코드를 회수할 수 있음
+                    await process.communicate()
 
             if process.returncode != 0:
                 logger.error(f"배치 프로세스 실패: 종료 코드 {process.returncode}")
@@ -219,11 +238,7 @@ class StockAnalysisOrchestrator:
         """
         logger.info(f"{len(message_paths)}개 텔레그램 메시지 전송 시작")
 
-        # 환경 변수에서 채널 ID 가져오기
-        from dotenv import load_dotenv
-        load_dotenv()
-
-        chat_id = os.getenv("TELEGRAM_CHANNEL_ID")
+        chat_id = self.telegram_channel_id
         if not chat_id:
             logger.error("텔레그램 채널 ID가 설정되지 않았습니다.")
             return
@@ -285,11 +300,7 @@ class StockAnalysisOrchestrator:
             # 텔레그램 메시지 생성
             message = self._create_trigger_alert_message(mode, all_results, trade_date)
 
-            # 환경 변수에서 채널 ID 가져오기
-            from dotenv import load_dotenv
-            load_dotenv()
-
-            chat_id = os.getenv("TELEGRAM_CHANNEL_ID")
+            chat_id = self.telegram_channel_id
             if not chat_id:
                 logger.error("텔레그램 채널 ID가 설정되지 않았습니다.")
                 return False
@@ -457,12 +468,8 @@ class StockAnalysisOrchestrator:
                     from stock_tracking_enhanced_agent import EnhancedStockTrackingAgent as StockTrackingAgent
                     from stock_tracking_agent import app as tracking_app
 
-                    # 환경 변수에서 채널 ID 및 봇 토큰 가져오기
-                    from dotenv import load_dotenv
-                    load_dotenv()
-
-                    chat_id = os.getenv("TELEGRAM_CHANNEL_ID")
-                    telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
+                    chat_id = self.telegram_channel_id
+                    telegram_token = self.telegram_bot_token
 
                     if not chat_id:
                         logger.error("텔레그램 채널 ID가 설정되지 않았습니다.")
@@ -655,6 +655,11 @@ class StockTrackingAgent:
                 )
             )
 
+            # JSON 객체가 전혀 없는 응답(거절/에러 문구 등)은 파싱 시도 없이 바로 기본값 반환
+            if "{" not in response:
+                logger.error(f"매매 시나리오 응답에 JSON 객체가 없습니다: {response[:500]}")
+                return self._default_scenario()
+
             # JSON 파싱
             # todo : model을 만들어서 generate_structured 함수 호출하여 코드 유지보수성 증가
             # todo : json 변환함수 utils로 이관하여 유지보수성 증가
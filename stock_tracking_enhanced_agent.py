@@ -840,6 +840,12 @@ class EnhancedStockTrackingAgent(StockTrackingAgent):
                 )
             )
 
+            # JSON 객체가 전혀 없는 응답은 파싱 시도 없이 바로 기존 알고리즘으로 폴백
+            if "{" not in response:
+                logger.error(f"매도 결정 응답에 JSON 객체가 없습니다: {response[:500]}")
+                logger.warning(f"{ticker} AI 분석 실패, 기존 알고리즘으로 폴백")
+                return await self._fallback_sell_decision(stock_data)
+
             # JSON 파싱
             try:
                 # 마크다운 코드 블록에서 JSON 추출 시도
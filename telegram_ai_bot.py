@@ -16,6 +16,7 @@ import re
 import signal
 import traceback
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from queue import Queue
 
@@ -71,6 +72,13 @@ HISTORY_CHOOSING_TICKER = 0  # /history 명령어를 위한 상태
 # 채널 ID
 CHANNEL_ID = int(os.getenv("TELEGRAM_CHANNEL_ID", "0"))
 
+# 그룹 채팅 유형
+GROUP_CHAT_TYPES = frozenset({"group", "supergroup"})
+
+# 채널 구독으로 인정하는 멤버 상태 (멤버, 관리자, 생성자/소유자)
+# 'creator'는 초기 버전에서 사용, 일부 버전에서는 'owner'로 변경될 수 있음
+VALID_MEMBER_STATUSES = frozenset({"member", "administrator", "creator", "owner"})
+
 class ConversationContext:
     """대화 컨텍스트 관리"""
     def __init__(self):
@@ -104,12 +112,13 @@ class ConversationContext:
 매매 배경: {self.background if self.background else "없음"}
 
 이전 대화 내역:"""
-        
-        for item in self.conversation_history:
-            role_label = "AI 답변" if item['role'] == 'assistant' else "사용자 질문"
-            context += f"\n\n{role_label}: {item['content']}"
-        
-        return context
+
+        history = "".join(
+            f"\n\n{'AI 답변' if item['role'] == 'assistant' else '사용자 질문'}: {item['content']}"
+            for item in self.conversation_history
+        )
+
+        return context + history
     
     def is_expired(self, hours: int = 24) -> bool:
         return (datetime.now() - self.last_updated) > timedelta(hours=hours)
@@ -129,11 +138,20 @@ class TelegramAIBot:
             HTML_REPORTS_DIR.mkdir(exist_ok=True)
             logger.info(f"HTML 보고서 디렉토리 생성: {HTML_REPORTS_DIR}")
 
-        # 채널 ID 확인
-        self.channel_id = int(os.getenv("TELEGRAM_CHANNEL_ID", "0"))
+        # 채널 ID 확인 (모듈 로드 시 한 번 읽어 둔 값 사용)
+        self.channel_id = CHANNEL_ID
         if not self.channel_id:
             logger.warning("텔레그램 채널 ID가 설정되지 않았습니다. 채널 구독 확인을 건너뜁니다.")
 
+        # 운영자 ID 허용 목록 (요청마다 환경변수를 다시 파싱하지 않도록 한 번만 계산)
+        admin_ids_str = os.getenv("TELEGRAM_ADMIN_IDS", "")
+        try:
+            self.admin_ids = frozenset(int(id_str) for id_str in admin_ids_str.split(",") if id_str.strip())
+        except ValueError as e:
+            # 잘못된 값이 있어도 봇은 기동하고, 기존처럼 운영자 예외 없이 구독 확인만 수행
+            logger.error(f"TELEGRAM_ADMIN_IDS 파싱 오류: {e}")
+            self.admin_ids = frozenset()
+
         # 종목 정보 초기화
         self.stock_map = {}
         self.stock_name_map = {}
@@ -496,7 +514,7 @@ class TelegramAIBot:
             return ConversationHandler.END
 
         # 그룹 채팅인지 개인 채팅인지 확인
-        is_group = update.effective_chat.type in ["group", "supergroup"]
+        is_group = update.effective_chat.type in GROUP_CHAT_TYPES
         greeting = f"{user_name}님, " if is_group else ""
 
         await update.message.reply_text(
@@ -579,7 +597,7 @@ class TelegramAIBot:
             return ConversationHandler.END
 
         # 그룹 채팅인지 개인 채팅인지 확인
-        is_group = update.effective_chat.type in ["group", "supergroup"]
+        is_group = update.effective_chat.type in GROUP_CHAT_TYPES
         greeting = f"{user_name}님, " if is_group else ""
 
         await update.message.reply_text(
@@ -663,12 +681,8 @@ class TelegramAIBot:
             if not self.channel_id:
                 return True
 
-            # 운영자 ID 허용 리스트
-            admin_ids_str = os.getenv("TELEGRAM_ADMIN_IDS", "")
-            admin_ids = [int(id_str) for id_str in admin_ids_str.split(",") if id_str.strip()]
-
             # 운영자인 경우 항상 허용
-            if user_id in admin_ids:
+            if user_id in self.admin_ids:
                 logger.info(f"운영자 {user_id} 접근 허용")
                 return True
 
@@ -678,15 +692,11 @@ class TelegramAIBot:
             # 상태 확인 및 로깅 추가
             logger.info(f"사용자 {user_id}의 채널 멤버십 상태: {member.status}")
 
-            # 채널 멤버, 관리자, 생성자/소유자 모두 허용
-            # 'creator'는 초기 버전에서 사용, 일부 버전에서는 'owner'로 변경될 수 있음
-            valid_statuses = ['member', 'administrator', 'creator', 'owner']
-
             # 채널 소유자인 경우 항상 허용
             if member.status == 'creator' or getattr(member, 'is_owner', False):
                 return True
 
-            return member.status in valid_statuses
+            return member.status in VALID_MEMBER_STATUSES
         except Exception as e:
             logger.error(f"채널 구독 확인 중 오류: {e}")
             # 디버깅을 위해 예외 상세 정보 로깅
@@ -710,7 +720,7 @@ class TelegramAIBot:
             return ConversationHandler.END
 
         # 그룹 채팅인지 개인 채팅인지 확인
-        is_group = update.effective_chat.type in ["group", "supergroup"]
+        is_group = update.effective_chat.type in GROUP_CHAT_TYPES
 
         logger.info(f"평가 명령 시작 - 사용자: {user_name}, 채팅타입: {'그룹' if is_group else '개인'}")
 
@@ -957,9 +967,9 @@ class TelegramAIBot:
         # 종목명으로 입력한 경우 - 정확히 일치하는 경우 확인
         logger.info(f"종목명 정확 일치 검색 시작: '{stock_input}'")
 
-        # 디버깅을 위한 키 샘플 로깅
-        sample_keys = list(self.stock_name_map.keys())[:5]
-        logger.debug(f"stock_name_map 키 샘플: {sample_keys}")
+        # 디버깅을 위한 키 샘플 로깅 (전체 키 목록을 만들지 않고 앞의 5개만 조회)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"stock_name_map 키 샘플: {list(islice(self.stock_name_map, 5))}")
 
         # 정확 일치 검사
         if stock_input in self.stock_name_map:
@@ -970,9 +980,10 @@ class TelegramAIBot:
             logger.info(f"정확 일치 실패: '{stock_input}'")
 
             # 입력값의 상세 정보 로깅
-            logger.debug(f"입력값 상세 - 길이: {len(stock_input)}, "
-                         f"바이트: {stock_input.encode('utf-8')}, "
-                         f"유니코드: {[ord(c) for c in stock_input]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"입력값 상세 - 길이: {len(stock_input)}, "
+                             f"바이트: {stock_input.encode('utf-8')}, "
+                             f"유니코드: {[ord(c) for c in stock_input]}")
 
         # 종목명 부분 일치 검색
         logger.info(f"부분 일치 검색 시작")
@@ -986,7 +997,7 @@ class TelegramAIBot:
 
                 if stock_input.lower() in name.lower():
                     possible_matches.append((name, code))
-                    logger.debug(f"부분 일치 발견: '{name}' ({code})")
+                    logger.debug("부분 일치 발견: '%s' (%s)", name, code)
 
         except Exception as e:
             logger.error(f"부분 일치 검색 중 오류: {e}")
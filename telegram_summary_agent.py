@@ -245,18 +245,19 @@ class TelegramSummaryGenerator:
             min_rating=QualityRating.EXCELLENT
         )
 
-        # 메시지 프롬프트 구성
+        # 트리거 모드가 morning인 경우 경고 문구 추가
+        morning_notice = ""
+        if metadata.get('trigger_mode') == 'morning':
+            logger.info("장 시작 후 10분 시점 데이터 경고 문구 추가")
+            morning_notice = "\n이 종목은 장 시작 후 10분 시점에 포착되었으며, 현재 상황과 차이가 있을 수 있습니다."
+
+        # 메시지 프롬프트 구성 (보고서 전문이 들어가므로 한 번에 조립)
         prompt_message = f"""다음은 {metadata['stock_name']}({metadata['stock_code']}) 종목에 대한 상세 분석 보고서입니다. 
             이 종목은 {trigger_type} 트리거에 포착되었습니다. 
             
             보고서 내용:
             {report_content}
-            """
-
-        # 트리거 모드가 morning인 경우 경고 문구 추가
-        if metadata.get('trigger_mode') == 'morning':
-            logger.info("장 시작 후 10분 시점 데이터 경고 문구 추가")
-            prompt_message += "\n이 종목은 장 시작 후 10분 시점에 포착되었으며, 현재 상황과 차이가 있을 수 있습니다."
+            {morning_notice}"""
 
         # 평가-최적화 워크플로우를 사용하여 텔레그램 메시지 생성
         response = await evaluator_optimizer.generate_str(
@@ -308,7 +309,7 @@ class TelegramSummaryGenerator:
 
         # 마지막 시도: 문자열로 변환하고 정규식으로 메시지 형식 추출
         response_str = str(response)
-        logger.debug(f"정규식 적용 전 응답 문자열: {response_str[:100]}...")
+        logger.debug("정규식 적용 전 응답 문자열: %.100s...", response_str)
 
         # 정규식으로 텔레그램 메시지 형식 추출 시도
         content_match = re.search(r'(📊|📈|📉|💰|⚠️|🔍).*?본 정보는 투자 참고용이며, 투자 결정과 책임은 투자자에게 있습니다\.', response_str, re.DOTALL)
@@ -362,6 +362,18 @@ def isPaperTrading():  # 모의투자 매매
     return _isPaper
 
 
+# (서버, 상품코드) -> 계좌번호 설정 키
+_ACCT_CFG_KEYS = {
+    ("prod", "01"): "my_acct_stock",  # 실전투자 주식투자, 위탁계좌, 투자계좌
+    ("prod", "03"): "my_acct_future",  # 실전투자 선물옵션(파생)
+    ("prod", "08"): "my_acct_future",  # 실전투자 해외선물옵션(파생)
+    ("prod", "22"): "my_acct_stock",  # 실전투자 개인연금저축계좌
+    ("prod", "29"): "my_acct_stock",  # 실전투자 퇴직연금계좌
+    ("vps", "01"): "my_paper_stock",  # 모의투자 주식투자, 위탁계좌, 투자계좌
+    ("vps", "03"): "my_paper_future",  # 모의투자 선물옵션(파생)
+}
+
+
 # 실전투자면 'prod', 모의투자면 'vps'를 셋팅 하시기 바랍니다.
 def changeTREnv(token_key, svr="prod", product=_cfg["my_prod"]):
     cfg = dict()
@@ -381,20 +393,9 @@ def changeTREnv(token_key, svr="prod", product=_cfg["my_prod"]):
     cfg["my_app"] = _cfg[ak1]
     cfg["my_sec"] = _cfg[ak2]
 
-    if svr == "prod" and product == "01":  # 실전투자 주식투자, 위탁계좌, 투자계좌
-        cfg["my_acct"] = _cfg["my_acct_stock"]
-    elif svr == "prod" and product == "03":  # 실전투자 선물옵션(파생)
-        cfg["my_acct"] = _cfg["my_acct_future"]
-    elif svr == "prod" and product == "08":  # 실전투자 해외선물옵션(파생)
-        cfg["my_acct"] = _cfg["my_acct_future"]
-    elif svr == "prod" and product == "22":  # 실전투자 개인연금저축계좌
-        cfg["my_acct"] = _cfg["my_acct_stock"]
-    elif svr == "prod" and product == "29":  # 실전투자 퇴직연금계좌
-        cfg["my_acct"] = _cfg["my_acct_stock"]
-    elif svr == "vps" and product == "01":  # 모의투자 주식투자, 위탁계좌, 투자계좌
-        cfg["my_acct"] = _cfg["my_paper_stock"]
-    elif svr == "vps" and product == "03":  # 모의투자 선물옵션(파생)
-        cfg["my_acct"] = _cfg["my_paper_future"]
+    acct_key = _ACCT_CFG_KEYS.get((svr, product))
+    if acct_key is not None:
+        cfg["my_acct"] = _cfg[acct_key]
 
     cfg["my_prod"] = product
     cfg["my_htsid"] = _cfg["my_htsid"]
@@ -527,18 +528,17 @@ class APIResp:
         return self._rescode
 
     def _setHeader(self):
-        fld = dict()
-        for x in self._resp.headers.keys():
-            if x.islower():
-                fld[x] = self._resp.headers.get(x)
+        fld = {x: v for x, v in self._resp.headers.items() if x.islower()}
         _th_ = namedtuple("header", fld.keys())
 
         return _th_(**fld)
 
     def _setBody(self):
-        _tb_ = namedtuple("body", self._resp.json().keys())
+        # 응답 본문 JSON은 한 번만 파싱
+        body = self._resp.json()
+        _tb_ = namedtuple("body", body.keys())
 
-        return _tb_(**self._resp.json())
+        return _tb_(**body)
 
     def getHeader(self):
         return self._header
@@ -777,17 +777,21 @@ def system_resp(data):
 
     rdic = json.loads(data)
 
-    tr_id = rdic["header"]["tr_id"]
+    header = rdic["header"]
+    body = rdic.get("body")
+
+    tr_id = header["tr_id"]
     if tr_id != "PINGPONG":
-        tr_key = rdic["header"]["tr_key"]
-        encrypt = rdic["header"]["encrypt"]
-    if rdic.get("body", None) is not None:
-        isOk = True if rdic["body"]["rt_cd"] == "0" else False
-        tr_msg = rdic["body"]["msg1"]
+        tr_key = header["tr_key"]
+        encrypt = header["encrypt"]
+    if body is not None:
+        isOk = True if body["rt_cd"] == "0" else False
+        tr_msg = body["msg1"]
         # 복호화를 위한 key 를 추출
-        if "output" in rdic["body"]:
-            iv = rdic["body"]["output"]["iv"]
-            ekey = rdic["body"]["output"]["key"]
+        output = body.get("output")
+        if output is not None:
+            iv = output["iv"]
+            ekey = output["key"]
         isUnSub = True if tr_msg[:5] == "UNSUB" else False
     else:
         isPingPong = True if tr_id == "PINGPONG" else False
@@ -29,8 +29,8 @@ def get_snapshot(trade_date: str) -> pd.DataFrame:
         raise ValueError(f"{trade_date}에 대한 OHLCV 데이터가 없습니다.")
 
     # 데이터 확인용
-    logger.debug(f"스냅샷 데이터 샘플: {df.head()}")
-    logger.debug(f"스냅샷 데이터 컬럼: {df.columns}")
+    logger.debug("스냅샷 데이터 샘플: %s", df.head())
+    logger.debug("스냅샷 데이터 컬럼: %s", df.columns)
 
     return df
 
@@ -58,8 +58,8 @@ def get_previous_snapshot(trade_date: str) -> (pd.DataFrame, str):
         raise ValueError(f"{prev_date}에 대한 OHLCV 데이터가 없습니다.")
 
     # 데이터 확인용
-    logger.debug(f"이전 거래일 데이터 샘플: {df.head()}")
-    logger.debug(f"이전 거래일 데이터 컬럼: {df.columns}")
+    logger.debug("이전 거래일 데이터 샘플: %s", df.head())
+    logger.debug("이전 거래일 데이터 컬럼: %s", df.columns)
 
     return df, prev_date
 
@@ -157,8 +157,8 @@ def trigger_morning_volume_surge(trade_date: str, snapshot: pd.DataFrame, prev_s
     prev = prev_snapshot.loc[common].copy()
 
     # 디버깅 정보
-    logger.debug(f"전일 종가 데이터 샘플: {prev['종가'].head()}")
-    logger.debug(f"당일 종가 데이터 샘플: {snap['종가'].head()}")
+    logger.debug("전일 종가 데이터 샘플: %s", prev['종가'].head())
+    logger.debug("당일 종가 데이터 샘플: %s", snap['종가'].head())
 
     # 절대적 기준 적용 (최소 거래대금, 거래량)
     snap = apply_absolute_filters(snap)
@@ -174,15 +174,16 @@ def trigger_morning_volume_surge(trade_date: str, snapshot: pd.DataFrame, prev_s
     # 전일대비등락률 계산 - 변경된 방식으로
     snap["전일대비등락률"] = ((snap["종가"] - prev["종가"]) / prev["종가"]) * 100
 
-    # 첫 10개 종목의 전일대비등락률 계산 과정 디버깅
-    for ticker in snap.index[:5]:
-        try:
-            today_close = snap.loc[ticker, "종가"]
-            yesterday_close = prev.loc[ticker, "종가"]
-            change_rate = ((today_close - yesterday_close) / yesterday_close) * 100
-            logger.debug(f"종목 {ticker} - 오늘종가: {today_close}, 전일종가: {yesterday_close}, 전일대비등락률: {change_rate:.2f}%")
-        except Exception as e:
-            logger.debug(f"디버깅 중 오류: {e}")
+    # 첫 10개 종목의 전일대비등락률 계산 과정 디버깅 (DEBUG 레벨에서만 계산)
+    if logger.isEnabledFor(logging.DEBUG):
+        for ticker in snap.index[:5]:
+            try:
+                today_close = snap.loc[ticker, "종가"]
+                yesterday_close = prev.loc[ticker, "종가"]
+                change_rate = ((today_close - yesterday_close) / yesterday_close) * 100
+                logger.debug(f"종목 {ticker} - 오늘종가: {today_close}, 전일종가: {yesterday_close}, 전일대비등락률: {change_rate:.2f}%")
+            except Exception as e:
+                logger.debug(f"디버깅 중 오류: {e}")
 
     snap["상승여부"] = snap["종가"] > snap["시가"]
 
@@ -533,11 +534,12 @@ def trigger_afternoon_volume_surge_flat(trade_date: str, snapshot: pd.DataFrame,
         logger.debug("trigger_afternoon_volume_surge_flat: 조건 충족 종목 없음")
         return pd.DataFrame()
 
-    # 디버깅용 로그 추가
-    for ticker in result.index[:3]:
-        logger.debug(f"횡보주 디버깅 - {ticker}: 거래량증가율 {result.loc[ticker, '거래량증가율']:.2f}%, "
-                     f"장중등락률 {result.loc[ticker, '장중등락률']:.2f}%, 전일대비등락률 {result.loc[ticker, '전일대비등락률']:.2f}%, "
-                     f"거래량 {result.loc[ticker, '거래량']:,}주, 전일거래량 {prev.loc[ticker, '거래량']:,}주")
+    # 디버깅용 로그 추가 (DEBUG 레벨에서만 계산)
+    if logger.isEnabledFor(logging.DEBUG):
+        for ticker in result.index[:3]:
+            logger.debug(f"횡보주 디버깅 - {ticker}: 거래량증가율 {result.loc[ticker, '거래량증가율']:.2f}%, "
+                         f"장중등락률 {result.loc[ticker, '장중등락률']:.2f}%, 전일대비등락률 {result.loc[ticker, '전일대비등락률']:.2f}%, "
+                         f"거래량 {result.loc[ticker, '거래량']:,}주, 전일거래량 {prev.loc[ticker, '거래량']:,}주")
 
     logger.debug(f"거래량 증가 횡보 포착 종목 수: {len(result)}")
     return enhance_dataframe(result.sort_values("복합점수", ascending=False).head(3))
@@ -655,7 +657,7 @@ def run_batch(trigger_time: str, log_level: str = "INFO", output_file: str = Non
                 logger.info(f"- {ticker} ({종목명})")
 
             # 상세 정보는 디버그 레벨에서만 출력
-            logger.debug(f"상세 정보:\n{df}\n{'-'*40}")
+            logger.debug("상세 정보:\n%s\n%s", df, '-' * 40)
 
     # 최종 선별 결과
     final_results = select_final_tickers(triggers)